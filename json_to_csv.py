@@ -13,20 +13,39 @@ Convert UpApp / Maccabi activities JSON → CSV
 """
 
 from pathlib import Path
-import json, re, pandas as pd
+from concurrent.futures import ProcessPoolExecutor
+import functools, json, re
 from datetime import datetime
 
+try:
+    import simdjson
+    _PARSER = simdjson.Parser()
+except ImportError:  # non-AVX2 machines / simdjson not installed
+    _PARSER = None
+
 # ---------- helpers --------------------------------------------------------- #
+_DIGIT_RE = re.compile(r"(\d+)")
+
 def normalize_time(t: str | None) -> str | None:
     """Return HH:MM with a leading zero if needed (e.g., '9:00' → '09:00')."""
     if not t:
         return None
-    m = re.match(r"(\d{1,2}):(\d{2})", t.strip())
-    return f"{int(m.group(1)):02d}:{m.group(2)}" if m else t.strip()
-
+    t = t.strip()
+    i = t.find(":")  # plain index scan — no regex needed for H:MM / HH:MM
+    if i > 0:
+        try:
+            return f"{int(t[:i]):02d}:{t[i + 1:i + 3]}"
+        except ValueError:
+            pass
+    return t
+
+@functools.lru_cache(maxsize=None)
 def parse_availability(text: str | None):
     """
     Return (spots_left, is_full, availability_status)
+
+    Cached: the JSON holds only a handful of distinct status strings, so
+    the regex/substring work runs once per unique value, not per row.
     Examples:
         'נשארו 5 מקומות' → (5, False, same text)
         'כבר מלא'        → (0, True,  same text)
@@ -35,89 +54,121 @@ def parse_availability(text: str | None):
     if not text:
         return None, False, "Available (no specific info)"
     text = text.strip()
-    is_full = any(word in text for word in ("מלא", "כבר מלא"))
-    m = re.search(r"(\d+)", text)
+    is_full = "מלא" in text  # "כבר מלא" contains "מלא", one scan suffices
+    m = _DIGIT_RE.search(text)
     spots_left = 0 if is_full else (int(m.group(1)) if m else None)
     return spots_left, is_full, text
 
-def make_iso_date(day: str, stamp: str) -> str:
+def csv_field(v) -> str:
+    """Render one CSV field, quoting only when the value requires it."""
+    if v is None:
+        return ""
+    s = v if isinstance(v, str) else str(v)
+    if '"' in s or "," in s or "\n" in s or "\r" in s:
+        return '"' + s.replace('"', '""') + '"'
+    return s
+
+def make_iso_date(day: str, year: int, month: int) -> str:
     """
     Compose YYYY-MM-DD from:
         * day  – e.g. "23"
-        * stamp – e.g. "2025-06-21T19:29:56.869541"
+        * year/month – taken from the extraction timestamp, parsed once
     """
-    ts = datetime.fromisoformat(stamp)
-    return f"{ts.year}-{ts.month:02d}-{int(day):02d}"
+    return f"{year}-{month:02d}-{int(day):02d}"
 
 # ---------- main ------------------------------------------------------------ #
-INPUT = Path("maccabi_activities_20250623_010818.json")
-OUTPUT = INPUT.with_suffix(".csv")
-
-with INPUT.open(encoding="utf-8") as fh:
-    blob = json.load(fh)
-
-rows = []
-timestamp = blob.get("extraction_info", {}).get("timestamp", "")
-
-for activity in blob.get("activities", []):
-    # Base‐level attributes
-    base = {
-        "location": activity.get("activity_name"),
-        "city":          activity.get("city"),
-        "instructor":    activity.get("instructor"),
-        "activity_type": activity.get("activity_type"),
-        "booking_url":   activity.get("booking_url"),
-        "description":   activity.get("description"),
-    }
-
-    # Schedule items might be paired with calendar_dates by position
-    # dates = [d.get("date") for d in activity.get("calendar_dates", [])]
-    schedules = activity.get("all_schedule_items", [])
-    # pairs = list(zip(dates, schedules)) if dates and len(dates) == len(schedules) else [(None, s) for s in schedules]
-    for sched in schedules:
-        day = sched.get("day_number")
-        # Date: from schedule item, matching calendar_dates, or inferred
-        date_val =  (make_iso_date(day, timestamp) if day else None) # inferred
-
-        # Extract start and end times
-        time_range = sched.get("time")
-        if time_range and "-" in time_range:
-            # Split on ' - ' or '-'
-            parts = [p.strip() for p in re.split(r"\s*-\s*", time_range)]
-            if len(parts) == 2:
-                start, end = normalize_time(parts[1]), normalize_time(parts[0])
-            else:
-                start = normalize_time(time_range)
-                end = None
-        else:
-            start = normalize_time(time_range)
-            end = None
-
-        spots, full, avail = parse_availability(sched.get("availability_status"))
-
-        rows.append({
-            **base,
-            "date":                 date_val,
-            "start_time":           start,
-            "end_time":             end,
-            "spots_left":           spots,
-            "is_full":              full,
-            "availability_status":  avail,
-            "instructor":           sched.get("instructor") or base["instructor"],
-            "raw_description":      sched.get("raw_description"),
-        })
-
-# Assemble DataFrame in the exact column order requested
 cols = [
     "location", "date", "start_time", "end_time", "city", "instructor",
     "activity_type", "spots_left", "is_full", "availability_status",
     "booking_url", "description", "raw_description"
 ]
-df = pd.DataFrame(rows)[cols]
 
-df.to_csv(OUTPUT, index=False, encoding="utf-8")
-print(f"Wrote {len(df)} rows → {OUTPUT}")
+def convert(path: Path) -> int:
+    """Convert one activities JSON file to CSV, return the row count."""
+    output = path.with_suffix(".csv")
+
+    if _PARSER is not None:
+        blob = _PARSER.load(str(path))
+    else:
+        with path.open(encoding="utf-8") as fh:
+            blob = json.load(fh)
+
+    timestamp = blob.get("extraction_info", {}).get("timestamp", "")
+    # Parse the extraction timestamp once, not per schedule item
+    ts = datetime.fromisoformat(timestamp)
+    year, month = ts.year, ts.month
+
+    # Stream rows straight to CSV — binary output through a row buffer, so
+    # UTF-8 encoding and write() syscalls are amortized over ~1 MB chunks
+    out_fh = output.open("wb")
+    buf = bytearray()
+    buf += (",".join(cols) + "\r\n").encode("utf-8")
+    row_count = 0
+    schedule_items_count = 0
+
+    for activity in blob.get("activities", []):
+        # Base‐level attributes, bound once per activity
+        base_location   = activity.get("activity_name")
+        base_city       = activity.get("city")
+        base_instructor = activity.get("instructor")
+        base_type       = activity.get("activity_type")
+        base_url        = activity.get("booking_url")
+        base_desc       = activity.get("description")
+
+        # Schedule items might be paired with calendar_dates by position
+        # dates = [d.get("date") for d in activity.get("calendar_dates", [])]
+        schedules = activity.get("all_schedule_items", [])
+        # pairs = list(zip(dates, schedules)) if dates and len(dates) == len(schedules) else [(None, s) for s in schedules]
+        schedule_items_count += len(schedules)
+        for sched in schedules:
+            day = sched.get("day_number")
+            # Date: from schedule item, matching calendar_dates, or inferred
+            date_val =  (make_iso_date(day, year, month) if day else None) # inferred
+
+            # Extract start and end times
+            time_range = sched.get("time")
+            if time_range and len(time_range) == 13 and time_range[5:8] == " - ":
+                # canonical "HH:MM - HH:MM" — constant-time slices, no scan
+                start, end = time_range[8:], time_range[:5]
+            elif time_range and "-" in time_range:
+                # Fields are ordered END - START in this data
+                end_s, _, start_s = time_range.partition("-")
+                start = normalize_time(start_s.strip())
+                end = normalize_time(end_s.strip())
+            else:
+                start = normalize_time(time_range)
+                end = None
 
-# Debug: count total schedule items in JSON
-schedule_items_count = sum(len(a.get("all_schedule_items", [])) for a in blob.get("activities", []))
-print(f"Total schedule items in JSON: {schedule_items_count}")
+            spots, full, avail = parse_availability(sched.get("availability_status"))
+
+            row = (
+                base_location, date_val, start, end, base_city,
+                sched.get("instructor") or base_instructor,
+                base_type, spots, full, avail,
+                base_url, base_desc,
+                sched.get("raw_description"),
+            )
+            buf += ",".join(map(csv_field, row)).encode("utf-8")
+            buf += b"\r\n"
+            if len(buf) >= 1 << 20:
+                out_fh.write(buf)
+                buf.clear()
+            row_count += 1
+
+    if buf:
+        out_fh.write(buf)
+    out_fh.close()
+    print(f"Wrote {row_count} rows → {output}")
+
+    # Debug: count accumulated while building rows — no second traversal
+    print(f"Total schedule items in JSON: {schedule_items_count}")
+    return row_count
+
+
+if __name__ == "__main__":
+    # The daily extraction runs leave many JSON files side by side — convert
+    # them in parallel, one worker process (and one parser) per file
+    files = sorted(Path(".").glob("maccabi_activities_*.json"))
+    with ProcessPoolExecutor() as ex:
+        counts = list(ex.map(convert, files))
+    print(f"Converted {len(files)} file(s), {sum(counts)} rows total")
@@ -14,36 +14,57 @@ prints the matching activities + schedule_items in JSON.
 
 import json
 import sys
-from datetime import datetime
 
+try:
+    import simdjson
+    _PARSER = simdjson.Parser()
+except ImportError:  # non-AVX2 machines / simdjson not installed
+    _PARSER = None
 
-def hhmm(t: str):
-    """Return a datetime.time from 'HH:MM'."""
-    return datetime.strptime(t.strip(), "%H:%M").time()
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 
-def schedule_in_range(item_time: str, range_start, range_end):
+def hm(t: str) -> int:
+    """Return minutes-since-midnight from 'HH:MM' (plain int, no strptime)."""
+    h, _, m = t.strip().partition(":")
+    return int(h) * 60 + int(m[:2])
+
+
+def schedule_in_range(item_time: str, range_start: int, range_end: int):
     """
     item_time comes as 'END - START' e.g. '09:00 - 08:00'.
     We want items whose START >= range_start and END <= range_end.
     """
-    end_str, start_str = (part.strip() for part in item_time.split("-"))
-    start, end = hhmm(start_str), hhmm(end_str)
-    return start >= range_start and end <= range_end
-
-
-def aaa(item, day_str):
-    return item['day_number'] == day_str
+    if len(item_time) == 13 and item_time[5:8] == " - ":
+        # canonical "HH:MM - HH:MM" — constant-time slices, no scan
+        return hm(item_time[8:]) >= range_start and hm(item_time[:5]) <= range_end
+    end_str, _, start_str = item_time.partition("-")
+    return hm(start_str) >= range_start and hm(end_str) <= range_end
 
 
 def filter_activities(data, day_str, range_start, range_end):
     wanted = []
     for act in data["activities"]:
         # keep only schedule_items in time-window
-        filtered_items = [
-            item for item in act["all_schedule_items"]
-            if schedule_in_range(item["time"], range_start, range_end) and aaa(item, day_str)
-        ]
+        # (cheap day compare first — most items fail it — and one dict
+        # lookup per field, bound to locals before use)
+        filtered_items = []
+        for item in act["all_schedule_items"]:
+            dn = item["day_number"]
+            if dn != day_str:
+                continue
+            t = item["time"]
+            if not schedule_in_range(t, range_start, range_end):
+                continue
+            # simdjson hands back lazy proxies that neither orjson nor the
+            # stdlib encoder can serialize — materialize only the items we
+            # actually keep (the rejected majority stays lazy)
+            if hasattr(item, "as_dict"):
+                item = item.as_dict()
+            filtered_items.append(item)
         if filtered_items:  # keep activity only if any slot fits
             # act_copy = {k: v for k, v in act.items() if k != "schedule_items"}
             # act_copy["schedule_items"] = filtered_items
@@ -63,12 +84,21 @@ def main():
     #     sys.exit(1)
     # path, day, start_s, end_s = sys.argv[1:]
 
-    with open(path, encoding="utf-8") as f:
-        data = json.load(f)
+    if _PARSER is not None:
+        data = _PARSER.load(path)
+    else:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
 
-    start_t, end_t = hhmm(start_s), hhmm(end_s)
+    start_t, end_t = hm(start_s), hm(end_s)
     result = filter_activities(data, day, start_t, end_t)
-    print(json.dumps(result, ensure_ascii=False, indent=2))
+    if orjson is not None:
+        sys.stdout.buffer.write(orjson.dumps(result, option=orjson.OPT_INDENT_2))
+        sys.stdout.buffer.write(b"\n")
+    else:
+        # stream straight to stdout instead of materializing the full string
+        json.dump(result, sys.stdout, ensure_ascii=False, indent=2)
+        sys.stdout.write("\n")
 
 
 if __name__ == "__main__":
@@ -14,15 +14,224 @@ Requirements:
 - App should be on the main activities list screen
 """
 
+import bisect
+import functools
+import hashlib
+import re
+import select
 import subprocess
+import sys
 import time
-import xml.etree.ElementTree as ET
+import traceback
 import html
 import json
 import os
 from datetime import datetime
 from typing import List, Dict, Optional, Tuple
 
+try:
+    # C-accelerated parser — the SAX-target parse in _parse_screen runs
+    # through libxml2 on the large UIAutomator dumps we re-read every
+    # 500ms while polling
+    from lxml import etree as ET
+except ImportError:
+    import xml.etree.ElementTree as ET
+
+# Keyword categories the readiness predicates look for, matched together in
+# a single scan of the joined screen text instead of one substring search
+# per keyword per predicate
+_KEYWORD_CATEGORIES = (
+    ('loading', ('טוען', 'Loading', 'מעמיס')),
+    ('activity_list', ('₪', 'תל אביב', 'רמת גן', 'פילאטיס', 'יוגה', 'סטודיו')),
+    ('calendar', ('ראשון', 'שני', 'שלישי')),
+    ('no_events', (
+        'אין לנו אימונים ביום הזה',  # We don't have training sessions on this day
+        'אפשר לחפש ביום אחר',       # You can search on another day
+        'אין אימונים',              # No training sessions
+        'אין פעילויות'              # No activities
+    )),
+    ('bottom', (
+        'סוף הרשימה',  # End of list
+        'אין עוד',        # No more
+        'זה הכל',         # That's all
+        'end of list',
+        'no more items',
+        'bottom',
+        'סיים'             # Finished
+    )),
+)
+
+# UIAutomator bounds attribute: "[x1,y1][x2,y2]"
+_BOUNDS_RE = re.compile(r'\[(\d+),(\d+)\]\[(\d+),(\d+)\]')
+
+# Fully-visible region of the 1080x2400 screen: margins for the status
+# bar (top), navigation bar (bottom) and side padding folded in once, so
+# the per-activity visibility check is a plain interval comparison
+_VISIBLE_LEFT = 50
+_VISIBLE_TOP = 100
+_VISIBLE_RIGHT = 1080 - 50
+_VISIBLE_BOTTOM = 2400 - 200
+
+# Schedule-line vocabulary: time ranges ("HH:MM - HH:MM"), digit runs and
+# Hebrew-letter presence, compiled/built once instead of per line
+_TIME_RE = re.compile(r'\d{1,2}:\d{2}\s*-\s*\d{1,2}:\d{2}')
+_DIGITS_RE = re.compile(r'\d+')
+_HEB_CHARS = frozenset('אבגדהוזחטיכלמנסעפצקרשת')
+
+# Hebrew day names as they appear in the day-selection bar ("23\nשני")
+_HEBREW_DAYS = frozenset(('ראשון', 'שני', 'שלישי', 'רביעי', 'חמישי', 'שישי', 'שבת'))
+
+# Activity-card detection keywords (find_activities_on_screen)
+_NAVIGATION_KEYWORDS = (
+    'מפה', 'map', 'דף הבית', 'upmind', 'upbody', 'upshop',
+    'חיפוש', 'search', 'בטל', 'אישור', 'סגור'
+)
+_LOCATION_INDICATORS = (
+    'תל אביב', 'רמת גן', 'פתח תקווה', 'הרצליה', 'רחובות', 'ראשון לציון',
+    'חולון', 'בת ים', 'גבעתיים', 'יהוד', 'אור יהודה', 'כפר סבא',
+    'דיזנגוף', 'רוטשילד', 'נחלת בנימין', 'פלורנטין', 'יפו', 'נווה צדק',
+    'רח\'', 'רחוב', 'שד\'', 'שדרות'
+)
+_ACTIVITY_KEYWORDS = (
+    'סטודיו', 'פילאטיס', 'יוגה', 'פיטנס', 'אימון', 'מכון', 'חדר כושר',
+    'Place', 'studio', 'fitness', 'gym'
+)
+_BOTTOM_UI_ELEMENTS = ('חזרה', 'back', 'home', 'דף הבית')
+_ON_SCREEN_INDICATORS = ('₪', 'תל אביב', 'רמת גן', 'פילאטיס', 'יוגה', 'אימון', 'סטודיו')
+
+
+def _alternation(needles) -> "re.Pattern":
+    """Compile a tuple of literal needles into one alternation regex.
+
+    One C-level scan of the text replaces a Python-level `in` per needle;
+    longest-first ordering keeps prefix-sharing needles unambiguous.
+    """
+    return re.compile('|'.join(map(re.escape, sorted(needles, key=len, reverse=True))))
+
+
+_HEB_DAY_RE = _alternation(tuple(_HEBREW_DAYS))
+_NAV_RE = _alternation(_NAVIGATION_KEYWORDS)
+_LOCATION_RE = _alternation(_LOCATION_INDICATORS)
+_ACTIVITY_KW_RE = _alternation(_ACTIVITY_KEYWORDS)
+_BOTTOM_UI_RE = _alternation(_BOTTOM_UI_ELEMENTS)
+_ON_SCREEN_RE = _alternation(_ON_SCREEN_INDICATORS)
+
+# Schedule-line classification: one alternation pass collects every keyword
+# hit, and the branches dispatch on set membership instead of rescanning
+# the line per keyword
+_AVAIL_WORDS = frozenset(('מלא', 'מקום', 'נשאר', 'נשארו', 'זמין'))
+_TYPE_WORDS = frozenset(('בסטודיו', 'בזום', 'אימון', 'פילאטיס', 'יוגה', 'FLOW', 'CLASSIC', 'Teen'))
+_INSTRUCTOR_BLOCKERS = frozenset(('מלא', 'מקום', 'בסטודיו', 'בזום'))
+_LINE_RE = _alternation(tuple(_AVAIL_WORDS | _TYPE_WORDS))
+
+# Fallback for _scan_text when pyahocorasick is absent: one alternation
+# over every categorized needle plus a needle -> (category, needle) map
+_KEYWORD_RE = _alternation(
+    tuple(needle for _, needles in _KEYWORD_CATEGORIES for needle in needles)
+)
+_KEYWORD_HITS = {
+    needle: (category, needle)
+    for category, needles in _KEYWORD_CATEGORIES for needle in needles
+}
+
+# Schedule-extraction vocabulary (extract_schedule_from_screen) - frozensets
+# so the per-description membership tests are hash lookups, not list scans
+_COMMON_ACTIVITY_TYPES = frozenset((
+    'כל סוגי הפעילות', 'אימון פונקציונלי', 'אימון תחנות', 'פילאטיס',
+    'FLOW', 'CLASSIC', 'Teen', 'יוגה'
+))
+_COMMON_INSTRUCTORS = frozenset(('כל המדריכים',))
+# Activity-type variations that look like instructor names but aren't
+_SKIP_NAMES = frozenset(('האטה בזום', 'אשטנגה בסטודיו'))
+
+@functools.lru_cache(maxsize=4096)
+def _lines(s: str) -> tuple:
+    """splitlines, memoized: day-bar and schedule content-descs get split by
+    several consumers per screen and recur across dumps, so each distinct
+    string is split exactly once."""
+    return tuple(s.splitlines())
+
+
+@functools.lru_cache(maxsize=4096)
+def _unescape(s: str) -> str:
+    """html.unescape, memoized and interned.
+
+    The same content-desc strings (activity names, day labels, nav buttons)
+    recur across hundreds of dumps per run; caching skips the entity scan
+    on repeats and interning makes later equality checks pointer compares.
+    """
+    return sys.intern(html.unescape(s))
+
+
+try:
+    # Streaming 64-bit hash for screen signatures; optional
+    import xxhash
+except ImportError:
+    xxhash = None
+
+try:
+    # Rust JSON encoder for the per-activity checkpoint saves; optional
+    import orjson
+except ImportError:
+    orjson = None
+
+class _NodeTarget:
+    """SAX-style parser target: harvests <node> attributes, builds no tree.
+
+    The C parser calls start() per element with just the attribute dict, so
+    a full dump parses without creating a single Element object.
+    """
+    __slots__ = ('clickable', 'descs')
+
+    def __init__(self):
+        self.clickable = []
+        self.descs = []
+
+    def start(self, tag, attrib):
+        if tag != 'node':
+            return
+        desc = attrib.get('content-desc')
+        if not desc:
+            return
+        desc = desc.strip()
+        if not desc:
+            return
+        desc = _unescape(desc)
+        self.descs.append(desc)
+        if attrib.get('clickable') == 'true':
+            self.clickable.append({
+                'desc': desc,
+                'bounds': attrib.get('bounds', ''),
+                'class': attrib.get('class', '')
+            })
+
+    def end(self, tag):
+        pass
+
+    def close(self):
+        return self.clickable, self.descs
+
+
+class _ScreenDump:
+    """Opaque handle for one captured screen.
+
+    Stands in for the old parsed-tree root: the SAX pass already harvested
+    everything _walk would extract, so the handle only needs a stable
+    identity to key the walk cache.
+    """
+    __slots__ = ()
+
+
+try:
+    import ahocorasick
+    _AUTOMATON = ahocorasick.Automaton()
+    for _category, _needles in _KEYWORD_CATEGORIES:
+        for _needle in _needles:
+            _AUTOMATON.add_word(_needle, (_category, _needle))
+    _AUTOMATON.make_automaton()
+except ImportError:
+    _AUTOMATON = None
+
 class MaccabiScraper:
     def __init__(self):
         self.results = []
@@ -33,11 +242,26 @@ class MaccabiScraper:
         self.start_time = time.time()  # Initialize start time immediately
         self.last_save_time = None
         self.output_filename = None  # Will be set once and reused
-        
+        self._jsonl_fp = None  # Sidecar append-only journal, opened lazily
+
+        # Long-lived adb shell - spawned lazily, saves the ~150-300ms adb
+        # handshake every tap/keyevent/dumpsys would otherwise pay
+        self._adb_shell = None
+
+        # Per-root traversal cache: id(root) -> (root, (clickable, descriptions))
+        # so predicate chains walk each parsed hierarchy only once
+        self._walk_cache = {}
+
+        # Dump-content cache: digest of the raw XML -> screen handle, so
+        # back-to-back captures of an unchanged screen (poll loops, scroll
+        # checks) skip the parse and share all memoized derived results
+        self._dump_cache = {}
+
         # In-memory activity state management
         self.discovered_activities = {}  # activity_name -> activity_data
         self.processed_activities = set()  # activity_names that are fully processed
         self.failed_activity_names = set()  # activity_names that failed processing
+        self._seen_activity_names = set()  # processed ∪ failed — single lookup for skip checks
         
         # MAP BUTTON PROTECTION - NEVER CLICK THESE COORDINATES!
         self.dangerous_map_button = {
@@ -50,113 +274,274 @@ class MaccabiScraper:
         print(f"🛡️ MAP BUTTON PROTECTION ENABLED - Map button top Y: {self.dangerous_map_button['top_y']}")
         print(f"🛡️ Will only click activities whose BOTTOM edge is ABOVE Y={self.dangerous_map_button['top_y']}")
         
-    def run_adb_command(self, command: str) -> Tuple[bool, str]:
-        """Execute ADB command and return success status and output"""
+    def run_adb_command(self, args: List[str]) -> Tuple[bool, str]:
+        """Execute an ADB command (argument list, no host shell) and return
+        success status and output"""
+        # Device-side shell commands go through the persistent adb shell;
+        # host-side commands (pull etc.) keep the one-shot path
+        if args and args[0] == "shell":
+            return self._sh(" ".join(args[1:]))
+        return self._run_one_shot(args)
+
+    def _run_one_shot(self, args: List[str], timeout: int = 60) -> Tuple[bool, str]:
+        """Run one adb invocation in its own subprocess (no /bin/sh wrapper)"""
         try:
-            result = subprocess.run(command, shell=True, capture_output=True, text=True, timeout=60)
+            result = subprocess.run(["adb", *args], capture_output=True, text=True, timeout=timeout)
             return result.returncode == 0, result.stdout.strip()
         except subprocess.TimeoutExpired:
-            print(f"⚠️ Command timed out: {command}")
+            print(f"⚠️ Command timed out: adb {' '.join(args)}")
             return False, ""
         except Exception as e:
-            print(f"❌ Command failed: {command} - {e}")
+            print(f"❌ Command failed: adb {' '.join(args)} - {e}")
             return False, ""
+
+    def _start_shell(self) -> None:
+        """(Re)spawn the persistent adb shell process"""
+        try:
+            self._adb_shell = subprocess.Popen(
+                ["adb", "shell"],
+                stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT, text=True, bufsize=1
+            )
+        except Exception as e:
+            print(f"⚠️ Failed to start persistent adb shell: {e}")
+            self._adb_shell = None
+
+    def _sh(self, command: str, timeout: int = 60) -> Tuple[bool, str]:
+        """Run a device shell command through the persistent adb shell"""
+        if self._adb_shell is None or self._adb_shell.poll() is not None:
+            self._start_shell()
+        if self._adb_shell is None:
+            return self._run_one_shot(["shell", command], timeout)
+
+        try:
+            self._adb_shell.stdin.write(command + '; echo "__DONE_$?__"\n')
+            self._adb_shell.stdin.flush()
+
+            lines = []
+            deadline = time.time() + timeout
+            while True:
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    raise TimeoutError(f"no sentinel within {timeout}s")
+                ready, _, _ = select.select([self._adb_shell.stdout], [], [], remaining)
+                if not ready:
+                    raise TimeoutError(f"no sentinel within {timeout}s")
+                line = self._adb_shell.stdout.readline()
+                if not line:
+                    raise RuntimeError("persistent adb shell closed")
+                line = line.rstrip('\r\n')
+                if line.startswith("__DONE_") and line.endswith("__"):
+                    rc = line[len("__DONE_"):-2]
+                    return rc == "0", "\n".join(lines).strip()
+                lines.append(line)
+        except Exception as e:
+            print(f"⚠️ Persistent adb shell failed: {e} - falling back to one-shot")
+            try:
+                self._adb_shell.kill()
+            except Exception:
+                pass
+            self._adb_shell = None
+            return self._run_one_shot(["shell", command], timeout)
     
-    def capture_screen(self, filename: str) -> Optional[ET.Element]:
-        """Capture UI hierarchy and return parsed XML root"""
-        dump_cmd = f"adb shell uiautomator dump /sdcard/{filename}.xml"
-        pull_cmd = f"adb pull /sdcard/{filename}.xml /tmp/{filename}.xml"
-        
-        success, _ = self.run_adb_command(dump_cmd)
-        if not success:
-            print(f"❌ Failed to dump UI for {filename}")
+    def _dump_ui_xml(self, timeout: int = 15, compressed: bool = False) -> Optional[bytes]:
+        """Dump the UI hierarchy straight over adb exec-out (no /sdcard or /tmp files)"""
+        cmd = ["adb", "exec-out", "uiautomator", "dump"]
+        if compressed:
+            cmd.append("--compressed")  # drops unimportant nodes, ~3-5x smaller XML
+        cmd.append("/dev/tty")
+        try:
+            result = subprocess.run(cmd, capture_output=True, timeout=timeout)
+        except subprocess.TimeoutExpired:
+            print("⚠️ UI dump timed out")
             return None
-            
-        success, _ = self.run_adb_command(pull_cmd)
-        if not success:
-            print(f"❌ Failed to pull UI dump for {filename}")
+        except Exception as e:
+            print(f"❌ UI dump failed: {e}")
             return None
-            
+
+        if result.returncode != 0:
+            return None
+        return self._extract_hierarchy(result.stdout)
+
+    @staticmethod
+    def _extract_hierarchy(data: bytes) -> Optional[bytes]:
+        """Trim an exec-out dump to the XML payload (drops the 'dumped to:' trailer)"""
+        start = data.find(b'<?xml')
+        end = data.rfind(b'</hierarchy>')
+        if start == -1 or end == -1:
+            return None
+        return data[start:end + len(b'</hierarchy>')]
+
+    def _parse_screen(self, xml_bytes: bytes) -> Optional["_ScreenDump"]:
+        """Parse a dump with a SAX target, harvesting _walk's lists directly.
+
+        Every consumer of a captured root goes through _walk for the
+        clickable elements / descriptions / joined text, so there is no
+        reason to build a tree at all: the C parser calls _NodeTarget.start
+        per node and never materializes Element objects - the single
+        largest cost of tree parsers on deep Android dumps. Callers get a
+        lightweight _ScreenDump handle whose _walk lookup is pre-seeded.
+
+        Identical dump bytes (an unchanged screen polled again) return the
+        previous handle without re-parsing, memoized predicates included.
+        """
+        digest = (xxhash.xxh3_64_digest(xml_bytes) if xxhash is not None
+                  else hashlib.blake2b(xml_bytes, digest_size=8).digest())
+        cached_handle = self._dump_cache.get(digest)
+        if cached_handle is not None and id(cached_handle) in self._walk_cache:
+            return cached_handle
+
         try:
-            tree = ET.parse(f'/tmp/{filename}.xml')
-            return tree.getroot()
+            parser = ET.XMLParser(target=_NodeTarget())
+            clickable, descriptions = ET.fromstring(xml_bytes, parser)
         except Exception as e:
-            print(f"❌ Failed to parse XML for {filename}: {e}")
+            print(f"❌ Failed to parse XML dump: {e}")
             return None
+
+        handle = _ScreenDump()
+        result = (clickable, descriptions, ' '.join(descriptions))
+        while len(self._walk_cache) > 8:
+            # drop oldest first - the cached lists are the only copy of
+            # this screen's content
+            self._walk_cache.pop(next(iter(self._walk_cache)))
+        self._walk_cache[id(handle)] = (handle, result, {})
+        while len(self._dump_cache) > 8:
+            self._dump_cache.pop(next(iter(self._dump_cache)))
+        self._dump_cache[digest] = handle
+        return handle
+
+    def capture_screen(self, filename: str) -> Optional[ET.Element]:
+        """Capture UI hierarchy and return parsed XML root"""
+        xml_bytes = self._dump_ui_xml()
+        if xml_bytes is None:
+            # Fall back to the slower dump-to-sdcard + pull path
+            dump_cmd = ["shell", "uiautomator", "dump", f"/sdcard/{filename}.xml"]
+            pull_cmd = ["pull", f"/sdcard/{filename}.xml", f"/tmp/{filename}.xml"]
+
+            success, _ = self.run_adb_command(dump_cmd)
+            if not success:
+                print(f"❌ Failed to dump UI for {filename}")
+                return None
+
+            success, _ = self.run_adb_command(pull_cmd)
+            if not success:
+                print(f"❌ Failed to pull UI dump for {filename}")
+                return None
+
+            try:
+                with open(f'/tmp/{filename}.xml', 'rb') as f:
+                    xml_bytes = f.read()
+            except Exception as e:
+                print(f"❌ Failed to read UI dump for {filename}: {e}")
+                return None
+
+        return self._parse_screen(xml_bytes)
     
     def wait_for_content_load(self, expected_content_type: str = "general", max_wait: int = 10) -> bool:
         """Smart waiting that checks for content loading and stops early when ready"""
         print(f"⏳ Waiting for {expected_content_type} content to load (max {max_wait}s)...")
         
         start_time = time.time()
-        check_interval = 0.5  # Check every 500ms
-        
+        attempt = 0
+        last_screen = self.current_screen()
+
         while time.time() - start_time < max_wait:
+            # Cheap readiness gate first: ~5KB of dumpsys over the
+            # persistent shell vs tens of KB of XML dump. A mid-transition
+            # activity (mResumed=false) can't have loaded content, so skip
+            # the expensive hierarchy dump until it settles. The app is a
+            # single-activity shell, so this can't distinguish its internal
+            # screens - the full dump below still does that part.
+            screen = self.current_screen()
+            if screen and screen != last_screen:
+                last_screen = screen
+                attempt = 0  # activity/fragment changed - re-check quickly
+            if screen and 'mResumed=false' in screen:
+                time.sleep(0.2)
+                continue
+
             # Capture current state to check if content is loaded
             root = self.capture_screen_quick("loading_check")
-            if root is None:
-                time.sleep(check_interval)
-                continue
-            
-            # Check for different types of loaded content
-            if expected_content_type == "activity_list":
-                if self.is_activity_list_loaded(root):
-                    elapsed = time.time() - start_time
-                    print(f"✅ Activity list loaded in {elapsed:.1f}s")
-                    return True
-            elif expected_content_type == "activity_detail":
-                if self.is_activity_detail_loaded(root):
-                    elapsed = time.time() - start_time
-                    print(f"✅ Activity detail loaded in {elapsed:.1f}s")
-                    return True
-            elif expected_content_type == "schedule":
-                if self.is_schedule_loaded(root):
-                    elapsed = time.time() - start_time
-                    print(f"✅ Schedule loaded in {elapsed:.1f}s")
-                    return True
-            else:  # general content
-                if self.is_general_content_loaded(root):
-                    elapsed = time.time() - start_time
-                    print(f"✅ Content loaded in {elapsed:.1f}s")
-                    return True
-            
+            if root is not None and self._content_loaded(root, expected_content_type):
+                elapsed = time.time() - start_time
+                print(f"✅ {expected_content_type} content loaded in {elapsed:.1f}s")
+                return True
+
+            # Exponential backoff: dump less often the longer we wait (the
+            # dumpsys probe above resets the cadence on a screen change)
+            attempt += 1
+            check_interval = min(1.0, 0.25 * (1.5 ** attempt))
             time.sleep(check_interval)
-        
+
         print(f"⚠️ Timeout waiting for {expected_content_type} content ({max_wait}s)")
         return False
+
+    def _content_loaded(self, root: ET.Element, expected_content_type: str) -> bool:
+        """Dispatch to the right is_*_loaded check for the expected content type"""
+        if expected_content_type == "activity_list":
+            return self.is_activity_list_loaded(root)
+        elif expected_content_type == "activity_detail":
+            return self.is_activity_detail_loaded(root)
+        elif expected_content_type == "schedule":
+            return self.is_schedule_loaded(root)
+        return self.is_general_content_loaded(root)
     
     def capture_screen_quick(self, filename: str) -> Optional[ET.Element]:
         """Quick screen capture without file operations for loading checks"""
         try:
-            dump_cmd = f"adb shell uiautomator dump /sdcard/{filename}_quick.xml"
-            pull_cmd = f"adb pull /sdcard/{filename}_quick.xml /tmp/{filename}_quick.xml"
-            
-            result = subprocess.run(dump_cmd, shell=True, capture_output=True, text=True, timeout=5)
-            if result.returncode != 0:
-                return None
-                
-            result = subprocess.run(pull_cmd, shell=True, capture_output=True, text=True, timeout=5)
-            if result.returncode != 0:
+            # Compressed dump is enough for the is_*_loaded keyword checks
+            xml_bytes = self._dump_ui_xml(timeout=5, compressed=True)
+            if xml_bytes is None:
                 return None
-            
-            tree = ET.parse(f'/tmp/{filename}_quick.xml')
-            return tree.getroot()
+            return self._parse_screen(xml_bytes)
         except:
             return None
-    
+
+    def current_screen(self) -> str:
+        """Resumed-activity probe: the ACTIVITY and mResumed lines from
+        dumpsys - an order of magnitude cheaper than a hierarchy dump"""
+        ok, out = self._sh("dumpsys activity top | grep -E 'ACTIVITY|mResumed'", timeout=10)
+        return out if ok else ""
+
+    def wait_for_ui_idle(self, timeout: float = 1.0, poll_interval: float = 0.15) -> None:
+        """Wait until the resumed-activity probe stops changing, up to timeout.
+
+        Replaces the fixed sleep between activities: returns as soon as two
+        consecutive cheap probes agree on a resumed window, so a fast UI
+        costs ~150ms instead of always paying the worst case.
+        """
+        deadline = time.time() + timeout
+        previous = self.current_screen()
+        while time.time() < deadline:
+            time.sleep(poll_interval)
+            probe = self.current_screen()
+            if probe and probe == previous and 'mResumed=false' not in probe:
+                return
+            previous = probe
+
+    def _scan_text(self, text: str) -> set:
+        """Return the set of (category, keyword) hits in one pass over text"""
+        if _AUTOMATON is not None:
+            return {value for _, value in _AUTOMATON.iter(text)}
+        # Single compiled-alternation scan instead of one `in` per needle
+        return {_KEYWORD_HITS[m] for m in _KEYWORD_RE.findall(text)}
+
+    def _scan(self, root: ET.Element) -> set:
+        """Keyword-category hits for the whole screen (memoized per root)"""
+        memo = self._memo(root)
+        hits = memo.get('scan')
+        if hits is None:
+            hits = memo['scan'] = self._scan_text(self.screen_text(root))
+        return hits
+
     def is_activity_list_loaded(self, root: ET.Element) -> bool:
         """Check if activity list screen is fully loaded"""
-        descriptions = self.extract_all_descriptions(root)
-        all_text = ' '.join(descriptions)
-        
-        # Look for activity indicators that show the list is loaded
-        activity_indicators = ['₪', 'תל אביב', 'רמת גן', 'פילאטיס', 'יוגה', 'סטודיו']
-        has_activities = sum(1 for indicator in activity_indicators if indicator in all_text) >= 2
-        
-        # Also check we're not seeing loading indicators
-        loading_indicators = ['טוען', 'Loading', 'מעמיס']
-        is_loading = any(indicator in all_text for indicator in loading_indicators)
-        
+        tags = self._scan(root)
+
+        # At least two distinct activity indicators and no loading indicator
+        has_activities = sum(1 for category, _ in tags if category == 'activity_list') >= 2
+        is_loading = any(category == 'loading' for category, _ in tags)
+
         return has_activities and not is_loading
     
     def is_activity_detail_loaded(self, root: ET.Element) -> bool:
@@ -167,46 +552,32 @@ class MaccabiScraper:
         # Look for detail screen indicators
         has_schedule_button = any('לוח פעילויות' in elem['desc'] for elem in clickable_elements)
         has_detail_content = any(len(desc) > 50 for desc in descriptions)  # Detailed descriptions
-        
+
         # Check we're not seeing loading indicators
-        all_text = ' '.join(descriptions)
-        loading_indicators = ['טוען', 'Loading', 'מעמיס']
-        is_loading = any(indicator in all_text for indicator in loading_indicators)
-        
+        is_loading = any(category == 'loading' for category, _ in self._scan(root))
+
         return (has_schedule_button or has_detail_content) and not is_loading
     
     def has_no_events_for_day(self, root: ET.Element) -> bool:
         """Check if we're seeing the 'no events' screen for current day"""
-        descriptions = self.extract_all_descriptions(root)
-        all_text = ' '.join(descriptions)
-        
-        # Look for "no events" indicators
-        no_events_indicators = [
-            'אין לנו אימונים ביום הזה',  # We don't have training sessions on this day
-            'אפשר לחפש ביום אחר',       # You can search on another day
-            'אין אימונים',              # No training sessions
-            'אין פעילויות'              # No activities
-        ]
-        
-        return any(indicator in all_text for indicator in no_events_indicators)
+        return any(category == 'no_events' for category, _ in self._scan(root))
     
     def is_schedule_loaded(self, root: ET.Element) -> bool:
         """Check if schedule screen is fully loaded"""
         descriptions = self.extract_all_descriptions(root)
-        all_text = ' '.join(descriptions)
-        
+        tags = self._scan(root)
+
         # First check if it's a "no events" screen - this is also "loaded"
-        if self.has_no_events_for_day(root):
+        if any(category == 'no_events' for category, _ in tags):
             return True
-        
+
         # Look for schedule indicators
-        has_calendar = any(day in all_text for day in ['ראשון', 'שני', 'שלישי'])
+        has_calendar = any(category == 'calendar' for category, _ in tags)
         has_times = any(':' in desc and '-' in desc for desc in descriptions)
-        
+
         # Check we're not seeing loading indicators
-        loading_indicators = ['טוען', 'Loading', 'מעמיס']
-        is_loading = any(indicator in all_text for indicator in loading_indicators)
-        
+        is_loading = any(category == 'loading' for category, _ in tags)
+
         return has_calendar and has_times and not is_loading
     
     def is_general_content_loaded(self, root: ET.Element) -> bool:
@@ -216,51 +587,68 @@ class MaccabiScraper:
         
         # Simple check: do we have reasonable amount of content?
         has_content = len(descriptions) > 5 or len(clickable_elements) > 3
-        
+
         # Check we're not seeing loading indicators
-        all_text = ' '.join(descriptions)
-        loading_indicators = ['טוען', 'Loading', 'מעמיס']
-        is_loading = any(indicator in all_text for indicator in loading_indicators)
-        
+        is_loading = any(category == 'loading' for category, _ in self._scan(root))
+
         return has_content and not is_loading
     
-    def get_screen_signature(self, root: ET.Element) -> str:
-        """Get a signature of the screen content for comparison"""
+    def get_screen_signature(self, root: ET.Element):
+        """Get a signature of the screen content for comparison.
+
+        Returns a 64-bit digest of the sorted clickable (desc, bounds) pairs
+        instead of a joined string - callers only ever compare signatures
+        with ==, so an int is enough and avoids the KB-sized allocation per
+        poll.
+        """
         try:
-            # Get all clickable element descriptions and their rough positions
-            clickable_elements = self.extract_clickable_elements(root)
-            
-            # Create a signature based on clickable elements (activities)
-            signature_parts = []
-            for elem in clickable_elements:
-                desc = elem['desc'][:50]  # First 50 chars
-                bounds = elem['bounds']
-                signature_parts.append(f"{desc}_{bounds}")
-            
-            # Sort to ensure consistent comparison
-            signature_parts.sort()
-            return "|".join(signature_parts)
+            memo = self._memo(root)
+            if 'signature' in memo:
+                return memo['signature']
+            # Signature based on clickable elements (activities) and their
+            # rough positions, sorted for consistent comparison
+            items = sorted(
+                (elem['desc'][:50], elem['bounds'])
+                for elem in self.extract_clickable_elements(root)
+            )
+            if xxhash is not None:
+                h = xxhash.xxh3_64()
+                for desc, bounds in items:
+                    h.update(desc.encode('utf-8'))
+                    h.update(b'|')
+                    h.update(bounds.encode('utf-8'))
+                    h.update(b'\n')
+                sig = h.intdigest()
+            else:
+                sig = hash(tuple(items))
+            memo['signature'] = sig
+            return sig
         except:
             return "unknown"
-    
+
+    def get_activities_signature(self, screen_activities: List[Dict], root: ET.Element):
+        """Signature of the screen as seen by the extraction loop.
+
+        Hashes only the detected activities (name + vertical position), so
+        clock ticks, battery level and other chrome outside the list can't
+        make two effectively-identical screens compare different and stall
+        the bottom detection. Falls back to the full clickable-element
+        signature when no activities were detected, where an empty tuple
+        would make every activity-free screen look identical.
+        """
+        if not screen_activities:
+            return self.get_screen_signature(root)
+        return hash(tuple(sorted((a['name'], a['y']) for a in screen_activities)))
+
     def is_at_bottom_of_list(self, root: ET.Element) -> bool:
         """Check if we're at the bottom of the activities list"""
-        descriptions = self.extract_all_descriptions(root)
-        all_text = ' '.join(descriptions)
-        
-        # Look for bottom indicators in Hebrew/English
-        bottom_indicators = [
-            'סוף הרשימה',  # End of list
-            'אין עוד',        # No more
-            'זה הכל',         # That's all
-            'end of list',
-            'no more items',
-            'bottom',
-            'סיים'             # Finished
-        ]
-        
-        # Check for typical bottom-of-list indicators
-        has_bottom_indicator = any(indicator in all_text.lower() for indicator in bottom_indicators)
+        all_text = self.screen_text(root)
+
+        # Check for typical bottom-of-list indicators (Hebrew/English; the
+        # English needles are lowercase, so scan the lowered text)
+        has_bottom_indicator = any(
+            category == 'bottom' for category, _ in self._scan_text(all_text.lower())
+        )
         
         # Additional check: if we have very few activities on screen, might be at bottom
         activities = self.find_activities_on_screen(root)
@@ -268,110 +656,181 @@ class MaccabiScraper:
         
         # Look for UI elements that typically appear at the bottom
         clickable_elements = self.extract_clickable_elements(root)
-        bottom_ui_elements = ['חזרה', 'back', 'home', 'דף הבית']
-        has_bottom_ui = any(any(ui_elem in elem['desc'].lower() for ui_elem in bottom_ui_elements) for elem in clickable_elements)
+        has_bottom_ui = any(_BOTTOM_UI_RE.search(elem['desc'].lower()) for elem in clickable_elements)
         
         return has_bottom_indicator or (has_few_activities and has_bottom_ui)
     
+    def tap_and_dump(self, x: int, y: int, settle_ms: int = 800) -> Tuple[bool, Optional[ET.Element]]:
+        """Tap, settle and dump the hierarchy in one batched device command.
+
+        Returns (tap_sent, root). tap_sent is True whenever the batched
+        command got far enough that the tap may have landed on the device —
+        the dump half failing afterwards (the routine "could not get idle
+        state") must never be mistaken for the tap not happening, because
+        the caller would re-tap coordinates that were only vetted against
+        the previous screen.
+        """
+        try:
+            result = subprocess.run(
+                ["adb", "exec-out", "sh", "-c",
+                 f"input tap {x} {y}; sleep {settle_ms / 1000:.1f}; uiautomator dump /dev/tty"],
+                capture_output=True, timeout=20
+            )
+        except FileNotFoundError as e:
+            # adb itself is missing - nothing reached the device
+            print(f"⚠️ Batched tap+dump failed: {e}")
+            return False, None
+        except Exception as e:
+            # Timeout or other failure after launch: the tap may already
+            # have landed, so report it as sent
+            print(f"⚠️ Batched tap+dump failed: {e}")
+            return True, None
+
+        if result.returncode != 0:
+            return True, None
+        xml_bytes = self._extract_hierarchy(result.stdout)
+        if xml_bytes is None:
+            return True, None
+        return True, self._parse_screen(xml_bytes)
+
     def tap_element(self, x: int, y: int, description: str = "") -> bool:
         """Tap at coordinates and wait smartly for content to load"""
         print(f"🖱️ Tapping at ({x}, {y}) - {description}")
-        success, _ = self.run_adb_command(f"adb shell input tap {x} {y}")
-        
+
         # Smart waiting based on what we expect to load
-        if "activity" in description.lower() and "schedule" not in description.lower():
-            self.wait_for_content_load("activity_detail", max_wait=15)  # Increased from 8 to 15 seconds
-        elif "schedule" in description.lower():
-            self.wait_for_content_load("schedule", max_wait=12)  # Increased from 6 to 12 seconds
+        desc_lower = description.lower()
+        if "activity" in desc_lower and "schedule" not in desc_lower:
+            content_type, max_wait = "activity_detail", 15  # Increased from 8 to 15 seconds
+        elif "schedule" in desc_lower:
+            content_type, max_wait = "schedule", 12  # Increased from 6 to 12 seconds
         else:
-            self.wait_for_content_load("general", max_wait=10)  # Increased from 5 to 10 seconds
-        
+            content_type, max_wait = "general", 10  # Increased from 5 to 10 seconds
+
+        # One round trip for the common case: tap + settle + dump batched
+        tap_sent, root = self.tap_and_dump(x, y)
+        if root is not None:
+            if self._content_loaded(root, content_type):
+                print(f"✅ {content_type} content ready after batched tap")
+                return True
+            # Tap landed but content is still loading - poll without re-tapping
+            self.wait_for_content_load(content_type, max_wait=max_wait)
+            return True
+
+        if tap_sent:
+            # The tap (very likely) landed but the dump half failed - never
+            # fire a second tap at coordinates that were safety-screened
+            # against the screen we just navigated away from
+            self.wait_for_content_load(content_type, max_wait=max_wait)
+            return True
+
+        # Batched command never reached the device - original tap then smart wait
+        success, _ = self.run_adb_command(["shell", "input", "tap", str(x), str(y)])
+        self.wait_for_content_load(content_type, max_wait=max_wait)
         return success
     
     def go_back(self) -> bool:
         """Press back button and wait smartly for transition"""
         print("⬅️ Going back")
-        success, _ = self.run_adb_command("adb shell input keyevent 4")
+        success, _ = self.run_adb_command(["shell", "input", "keyevent", "4"])
         
         # Smart waiting for back navigation - expect to return to activity list
         self.wait_for_content_load("activity_list", max_wait=12)  # Increased from 8 to 12 seconds
         return success
     
+    def _walk(self, root: ET.Element) -> Tuple[List[Dict], List[str], str]:
+        """Cached (clickable, descriptions, joined text) for a captured screen.
+
+        Every capture path returns a _ScreenDump whose lists were harvested
+        during the SAX parse and seeded into the walk cache, so this is a
+        plain cache lookup - there is no tree left to traverse. An evicted
+        handle means the screen is stale; treat it as empty rather than
+        crash (callers re-capture on their next poll anyway).
+        """
+        cached = self._walk_cache.get(id(root))
+        if cached is not None and cached[0] is root:
+            return cached[1]
+
+        print("⚠️ Screen handle outlived the walk cache - returning empty")
+        return ([], [], '')
+
     def extract_clickable_elements(self, root: ET.Element) -> List[Dict]:
         """Extract all clickable elements with their descriptions and bounds"""
-        elements = []
-        for elem in root.iter('node'):
-            if elem.get('clickable') == 'true':
-                desc = elem.get('content-desc', '').strip()
-                bounds = elem.get('bounds', '')
-                if desc:
-                    elements.append({
-                        'desc': html.unescape(desc),
-                        'bounds': bounds,
-                        'class': elem.get('class', '')
-                    })
-        return elements
-    
+        return self._walk(root)[0]
+
     def extract_all_descriptions(self, root: ET.Element) -> List[str]:
         """Extract all content descriptions from UI"""
-        descriptions = []
-        for elem in root.iter('node'):
-            desc = elem.get('content-desc', '').strip()
-            if desc:
-                descriptions.append(html.unescape(desc))
-        return descriptions
+        return self._walk(root)[1]
+
+    def screen_text(self, root: ET.Element) -> str:
+        """All content descriptions joined once per screen (cached with _walk)"""
+        return self._walk(root)[2]
+
+    def _memo(self, root: ET.Element) -> Dict:
+        """Per-root scratch dict for memoizing derived results.
+
+        wait_for_content_load and the run loop call the same predicates
+        against the same root several times per poll; anything derived from
+        a screen (keyword scan, signature, activity list) is computed once
+        and parked here, living and dying with the _walk cache entry.
+        """
+        cached = self._walk_cache.get(id(root))
+        if cached is not None and cached[0] is root:
+            return cached[2]
+        # Evicted handle - same stale-screen case _walk tolerates; hand
+        # back a throwaway dict so predicates run (over the empty walk
+        # results) instead of raising
+        return {}
     
-    def parse_bounds(self, bounds_str: str) -> Tuple[int, int]:
-        """Parse bounds string and return center coordinates"""
+    def parse_bounds_rect(self, bounds_str: str) -> Optional[Tuple[int, int, int, int]]:
+        """Parse a bounds string once into (x1, y1, x2, y2), or None"""
         try:
-            # Format: [x1,y1][x2,y2]
-            import re
-            # Use regex to extract coordinates more reliably
-            coords = re.findall(r'\[(\d+),(\d+)\]', bounds_str)
-            if len(coords) >= 2:
-                x1, y1 = map(int, coords[0])
-                x2, y2 = map(int, coords[1])
-                center_x = (x1 + x2) // 2
-                center_y = (y1 + y2) // 2
-                return center_x, center_y
-            return 0, 0
+            m = _BOUNDS_RE.search(bounds_str) if bounds_str else None
+            if m:
+                x1, y1, x2, y2 = map(int, m.groups())
+                return x1, y1, x2, y2
+            return None
         except Exception as e:
             print(f"⚠️ Failed to parse bounds: {bounds_str} - {e}")
+            return None
+
+    def parse_bounds(self, bounds_str: str) -> Tuple[int, int]:
+        """Parse bounds string and return center coordinates"""
+        rect = self.parse_bounds_rect(bounds_str)
+        if rect is None:
             return 0, 0
+        x1, y1, x2, y2 = rect
+        return (x1 + x2) // 2, (y1 + y2) // 2
     
-    def update_activity_discovery(self, screen_activities: List[Dict]) -> None:
-        """Update the discovered activities map with new activities found on screen"""
-        for activity in screen_activities:
-            activity_name = activity['description'].split('\n')[0] if '\n' in activity['description'] else activity['description']
-            
-            # Always update coordinates (activities might shift during scrolling)
-            if activity_name not in self.discovered_activities:
-                print(f"📍 Discovered new activity: {activity_name[:50]}...")
-            else:
-                # Update coordinates if activity moved
-                old_coords = (self.discovered_activities[activity_name]['x'], self.discovered_activities[activity_name]['y'])
-                new_coords = (activity['x'], activity['y'])
-                if old_coords != new_coords:
-                    print(f"📍 Updated coordinates for {activity_name[:30]}...: {old_coords} -> {new_coords}")
-            
-            self.discovered_activities[activity_name] = activity
+    def update_activity_discovery(self, activity: Dict) -> None:
+        """Update the discovered activities map with one activity found on screen"""
+        activity_name = activity['name']
+
+        # Always update coordinates (activities might shift during scrolling)
+        known = self.discovered_activities.get(activity_name)
+        if known is None:
+            print(f"📍 Discovered new activity: {activity_name[:50]}...")
+        elif known['x'] != activity['x'] or known['y'] != activity['y']:
+            print(f"📍 Updated coordinates for {activity_name[:30]}...: ({known['x']}, {known['y']}) -> ({activity['x']}, {activity['y']})")
+
+        self.discovered_activities[activity_name] = activity
     
     def get_next_unprocessed_activity(self) -> Optional[Dict]:
         """Get the next activity that hasn't been processed yet"""
         for activity_name, activity_data in self.discovered_activities.items():
-            if (activity_name not in self.processed_activities and 
-                activity_name not in self.failed_activity_names):
+            if activity_name not in self._seen_activity_names:
                 return activity_data
         return None
     
     def mark_activity_processed(self, activity_name: str) -> None:
         """Mark an activity as successfully processed"""
         self.processed_activities.add(activity_name)
+        self._seen_activity_names.add(activity_name)
         print(f"✅ Marked as processed: {activity_name[:40]}...")
     
     def mark_activity_failed(self, activity_name: str) -> None:
         """Mark an activity as failed to process"""
         self.failed_activity_names.add(activity_name)
+        self._seen_activity_names.add(activity_name)
         print(f"❌ Marked as failed: {activity_name[:40]}...")
     
     def get_discovery_stats(self) -> Dict:
@@ -389,6 +848,9 @@ class MaccabiScraper:
         }
     def find_activities_on_screen(self, root: ET.Element) -> List[Dict]:
         """Find activity items on the current screen - improved detection with less strict filtering"""
+        memo = self._memo(root)
+        if 'activities' in memo:
+            return memo['activities']
         activities = []
         clickable_elements = self.extract_clickable_elements(root)
         
@@ -399,43 +861,33 @@ class MaccabiScraper:
             if elem['bounds'] == self.dangerous_map_button['exact_bounds']:
                 print("⚠️ Skipping dangerous map button (exact match)")
                 continue
-            
-            # Parse bounds to check if element overlaps with map button area
-            try:
-                import re
-                coords = re.findall(r'\[(\d+),(\d+)\]', elem['bounds'])
-                if len(coords) >= 2:
-                    x1, y1 = map(int, coords[0])  # Top-left corner
-                    x2, y2 = map(int, coords[1])  # Bottom-right corner
-                    
-                    # Check if this element's BOTTOM edge is BELOW the map button's TOP edge
-                    # If so, skip it to avoid any overlap with map button
-                    if y2 >= self.dangerous_map_button['top_y']:
-                        elem_desc = elem['desc'][:30] if elem['desc'] else 'Unknown element'
-                        print(f"⚠️ Skipping element '{elem_desc}...' - bottom edge Y={y2} overlaps with map button (top Y={self.dangerous_map_button['top_y']})")
-                        continue
-                    
-                    # Additional safety check for elements in the general map button area
-                    if (self.dangerous_map_button['min_x'] <= x1 <= self.dangerous_map_button['max_x'] and
-                        self.dangerous_map_button['min_y'] <= y1 <= self.dangerous_map_button['max_y']):
-                        print(f"⚠️ Skipping element '{elem_desc}...' - in map button safety zone")
-                        continue
-                        
-            except Exception as e:
-                print(f"⚠️ Error parsing bounds {elem['bounds']}: {e}")
+
+            # Parse bounds ONCE per element; every later check reuses the rect
+            rect = self.parse_bounds_rect(elem['bounds'])
+            if rect is None:
                 # If we can't parse bounds, skip the element to be safe
+                print(f"⚠️ Error parsing bounds {elem['bounds']}")
+                continue
+            x1, y1, x2, y2 = rect
+            elem_desc = elem['desc'][:30] if elem['desc'] else 'Unknown element'
+
+            # Check if this element's BOTTOM edge is BELOW the map button's TOP edge
+            # If so, skip it to avoid any overlap with map button
+            if y2 >= self.dangerous_map_button['top_y']:
+                print(f"⚠️ Skipping element '{elem_desc}...' - bottom edge Y={y2} overlaps with map button (top Y={self.dangerous_map_button['top_y']})")
                 continue
+
+            # Additional safety check for elements in the general map button area
+            if (self.dangerous_map_button['min_x'] <= x1 <= self.dangerous_map_button['max_x'] and
+                self.dangerous_map_button['min_y'] <= y1 <= self.dangerous_map_button['max_y']):
+                print(f"⚠️ Skipping element '{elem_desc}...' - in map button safety zone")
+                continue
+
             desc = elem['desc']
             
             # SIMPLIFIED FILTERING: Only block obvious navigation elements
-            navigation_keywords = [
-                'מפה', 'map', 'דף הבית', 'upmind', 'upbody', 'upshop',
-                'חיפוש', 'search', 'בטל', 'אישור', 'סגור'
-            ]
-            
-            # Quick navigation check
             desc_lower = desc.lower().strip()
-            is_navigation = any(nav in desc_lower for nav in navigation_keywords)
+            is_navigation = _NAV_RE.search(desc_lower) is not None
             
             if is_navigation:
                 continue
@@ -449,20 +901,10 @@ class MaccabiScraper:
             has_multiple_lines = len(desc.split('\n')) >= 2  # Reduced from 3 to 2
             
             # Location indicators (cities, neighborhoods, streets)
-            location_indicators = [
-                'תל אביב', 'רמת גן', 'פתח תקווה', 'הרצליה', 'רחובות', 'ראשון לציון',
-                'חולון', 'בת ים', 'גבעתיים', 'יהוד', 'אור יהודה', 'כפר סבא',
-                'דיזנגוף', 'רוטשילד', 'נחלת בנימין', 'פלורנטין', 'יפו', 'נווה צדק',
-                'רח\'', 'רחוב', 'שד\'', 'שדרות'
-            ]
-            has_location = any(location in desc for location in location_indicators)
-            
+            has_location = _LOCATION_RE.search(desc) is not None
+
             # Activity type indicators
-            activity_keywords = [
-                'סטודיו', 'פילאטיס', 'יוגה', 'פיטנס', 'אימון', 'מכון', 'חדר כושר',
-                'Place', 'studio', 'fitness', 'gym'
-            ]
-            has_activity_keyword = any(keyword in desc for keyword in activity_keywords)
+            has_activity_keyword = _ACTIVITY_KW_RE.search(desc) is not None
             
             # IMPROVED DETECTION: Accept if it has price OR (location AND activity keyword)
             is_potential_activity = (
@@ -471,106 +913,66 @@ class MaccabiScraper:
             )
             
             if is_potential_activity:
-                x, y = self.parse_bounds(elem['bounds'])
+                # Center coordinates from the already-parsed rect
+                x, y = (x1 + x2) // 2, (y1 + y2) // 2
                 if x > 0 and y > 0:  # Valid coordinates
-                    
-                    # CRITICAL: Check if activity's bottom edge is above map button
-                    bounds = elem['bounds']
-                    if bounds and '[' in bounds:
-                        import re
-                        coords = re.findall(r'\[(\d+),(\d+)\]', bounds)
-                        if len(coords) >= 2:
-                            x1, y1 = map(int, coords[0])  # Top-left
-                            x2, y2 = map(int, coords[1])  # Bottom-right
-                            
-                            # Skip if activity's bottom edge touches or overlaps with map button
-                            if y2 >= self.dangerous_map_button['top_y']:
-                                activity_name = desc.split('\n')[0] if '\n' in desc else desc
-                                print(f"⚠️ Skipping activity '{activity_name[:25]}...' - bottom Y={y2} >= map top Y={self.dangerous_map_button['top_y']}")
-                                continue
-                    
+                    # (bottom edge vs. map button already checked above)
+
                     # Additional safety check for bottom navigation area
                     if y > 1900:  # Keep existing check as backup
                         continue
-                    
+
                     # Check element size to avoid tiny buttons
-                    bounds = elem['bounds']
-                    if bounds and '[' in bounds:
-                        import re
-                        coords = re.findall(r'\[(\d+),(\d+)\]', bounds)
-                        if len(coords) >= 2:
-                            x1, y1 = map(int, coords[0])
-                            x2, y2 = map(int, coords[1])
-                            width = x2 - x1
-                            height = y2 - y1
-                            
-                            # Skip very small elements (reduced threshold)
-                            if width < 150 or height < 80:
-                                continue
-                    
+                    width = x2 - x1
+                    height = y2 - y1
+
+                    # Skip very small elements (reduced threshold)
+                    if width < 150 or height < 80:
+                        continue
+
+                    # First line of the description is the activity name — split
+                    # it once here so every consumer reuses it instead of
+                    # re-splitting the multi-line description. Interned: the
+                    # same names recur on every scan, and one shared object
+                    # gives the skip-sets a cached hash and pointer-equality
+                    activity_name = sys.intern(desc.partition('\n')[0])
                     activities.append({
+                        'name': activity_name,
                         'description': desc,
                         'x': x,
                         'y': y,
                         'bounds': elem['bounds'],
+                        'rect': rect,
                         'detection_reason': 'price' if has_price else 'location+activity'
                     })
-                    
-                    activity_name = desc.split('\n')[0] if '\n' in desc else desc
+
                     reason = "(has price)" if has_price else "(location+keyword)"
                     print(f"✅ Found activity {reason}: {activity_name[:40]}... at ({x}, {y})")
         
         # Sort activities by Y coordinate (top to bottom) to process from top
         activities.sort(key=lambda a: a['y'])
-        
+
+        memo['activities'] = activities
         return activities
     
-    def is_activity_fully_visible(self, activity: Dict, root: ET.Element) -> bool:
+    def is_activity_fully_visible(self, activity: Dict) -> bool:
         """Check if an activity is fully visible on screen (not cut off at edges)"""
-        try:
-            # Get screen dimensions by finding the maximum coordinates in the UI
-            screen_height = 2400  # Typical Android screen height
-            screen_width = 1080   # Typical Android screen width
-            
-            # Parse activity bounds to get actual dimensions
-            bounds = activity['bounds']
-            if bounds and '[' in bounds:
-                import re
-                coords = re.findall(r'\[(\d+),(\d+)\]', bounds)
-                if len(coords) >= 2:
-                    x1, y1 = map(int, coords[0])
-                    x2, y2 = map(int, coords[1])
-                    
-                    # Check if activity is fully visible (not cut off at screen edges)
-                    # Leave some margin for UI elements (status bar, navigation bar)
-                    margin_top = 100     # Status bar area
-                    margin_bottom = 200  # Navigation bar area
-                    margin_sides = 50    # Side margins
-                    
-                    # Activity is fully visible if:
-                    # - Top edge is below status bar
-                    # - Bottom edge is above navigation bar
-                    # - Left and right edges are within screen bounds
-                    is_fully_visible = (
-                        y1 >= margin_top and                    # Not cut off at top
-                        y2 <= screen_height - margin_bottom and # Not cut off at bottom
-                        x1 >= margin_sides and                  # Not cut off at left
-                        x2 <= screen_width - margin_sides       # Not cut off at right
-                    )
-                    
-                    if not is_fully_visible:
-                        activity_name = activity['description'].split('\n')[0] if '\n' in activity['description'] else activity['description']
-                        print(f"   📏 Activity bounds check for {activity_name[:25]}...: [{x1},{y1}][{x2},{y2}] - {'✅ fully visible' if is_fully_visible else '❌ partially cut off'}")
-                    
-                    return is_fully_visible
-            
-            # If we can't parse bounds, assume it's visible
+        # Rect was parsed once at detection time; fall back for dicts built
+        # elsewhere. If we can't determine the bounds, assume visible to
+        # avoid missing activities.
+        rect = activity.get('rect') or self.parse_bounds_rect(activity['bounds'])
+        if rect is None:
             return True
-            
-        except Exception as e:
-            print(f"⚠️ Error checking activity visibility: {e}")
-            # If we can't determine visibility, assume it's visible to avoid missing activities
+        x1, y1, x2, y2 = rect
+
+        # Plain interval test against the precomputed visible region:
+        # below the status bar, above the navigation bar, inside the sides
+        if (y1 >= _VISIBLE_TOP and y2 <= _VISIBLE_BOTTOM and
+                x1 >= _VISIBLE_LEFT and x2 <= _VISIBLE_RIGHT):
             return True
+
+        print(f"   📏 Activity bounds check for {activity['name'][:25]}...: [{x1},{y1}][{x2},{y2}] - ❌ partially cut off")
+        return False
     
     def get_current_selected_day(self, root: ET.Element) -> Optional[Dict]:
         """Find the currently selected day from the day selection bar"""
@@ -579,14 +981,13 @@ class MaccabiScraper:
         for elem in clickable_elements:
             desc = elem['desc']
             # Look for day patterns like "23\nשני" (number + day name)
-            if '\n' in desc and len(desc.split('\n')) == 2:
-                parts = desc.split('\n')
+            parts = _lines(desc)
+            if len(parts) == 2:
                 if parts[0].strip().isdigit():
-                    day_number = parts[0].strip()
-                    day_name = parts[1].strip()
+                    day_number = sys.intern(parts[0].strip())
+                    day_name = sys.intern(parts[1].strip())
                     # Check if this seems like a Hebrew day name
-                    hebrew_days = ['ראשון', 'שני', 'שלישי', 'רביעי', 'חמישי', 'שישי', 'שבת']
-                    if day_name in hebrew_days:
+                    if day_name in _HEBREW_DAYS:
                         x, y = self.parse_bounds(elem['bounds'])
                         return {
                             'day_number': day_number,
@@ -605,14 +1006,13 @@ class MaccabiScraper:
         for elem in clickable_elements:
             desc = elem['desc']
             # Look for day patterns like "23\nשני" (number + day name)
-            if '\n' in desc and len(desc.split('\n')) == 2:
-                parts = desc.split('\n')
+            parts = _lines(desc)
+            if len(parts) == 2:
                 if parts[0].strip().isdigit():
-                    day_number = parts[0].strip()
-                    day_name = parts[1].strip()
+                    day_number = sys.intern(parts[0].strip())
+                    day_name = sys.intern(parts[1].strip())
                     # Check if this seems like a Hebrew day name
-                    hebrew_days = ['ראשון', 'שני', 'שלישי', 'רביעי', 'חמישי', 'שישי', 'שבת']
-                    if day_name in hebrew_days:
+                    if day_name in _HEBREW_DAYS:
                         x, y = self.parse_bounds(elem['bounds'])
                         days.append({
                             'day_number': day_number,
@@ -631,7 +1031,7 @@ class MaccabiScraper:
         print(f"📅 Switching to day {day['day_number']} ({day['day_name']}) at coordinates ({day['x']}, {day['y']})")
         
         # Use direct tap instead of smart waiting to avoid interference
-        success, _ = self.run_adb_command(f"adb shell input tap {day['x']} {day['y']}")
+        success, _ = self.run_adb_command(["shell", "input", "tap", str(day['x']), str(day['y'])])
         
         if success:
             print(f"✅ Tap successful for day {day['day_number']}")
@@ -656,49 +1056,59 @@ class MaccabiScraper:
             'timestamp': datetime.now().isoformat()
         }
         
-        # Extract calendar dates (day numbers with Hebrew day names)
+        # Partition once: the calendar and schedule-item scans only look at
+        # multi-line descriptions, the type/instructor scan only at
+        # single-line ones - no re-checking '\n' per loop
+        multi_line = []
+        single_line = []
         for desc in all_descriptions:
-            if '\n' in desc and any(day in desc for day in ['ראשון', 'שני', 'שלישי', 'רביעי', 'חמישי', 'שישי', 'שבת']):
-                date_parts = desc.split('\n')
+            (multi_line if '\n' in desc else single_line).append(desc)
+
+        # Extract calendar dates (day numbers with Hebrew day names)
+        for desc in multi_line:
+            if _HEB_DAY_RE.search(desc):
+                date_parts = _lines(desc)
                 if len(date_parts) == 2 and date_parts[0].strip().isdigit():
+                    # Interned: the same few date/day strings recur across
+                    # every day and every activity
                     result['calendar_dates'].append({
-                        'date': date_parts[0].strip(),
-                        'day': date_parts[1].strip()
+                        'date': sys.intern(date_parts[0].strip()),
+                        'day': sys.intern(date_parts[1].strip())
                     })
         
         # Extract activity types and instructors from single-line descriptions
-        common_activity_types = ['כל סוגי הפעילות', 'אימון פונקציונלי', 'אימון תחנות', 'פילאטיס', 'FLOW', 'CLASSIC', 'Teen', 'יוגה']
-        common_instructors = ['כל המדריכים']
-        
-        for desc in all_descriptions:
-            # Skip multi-line descriptions for this section
-            if '\n' in desc:
-                continue
-                
-            if desc in common_activity_types:
-                if desc not in result['activity_types']:
+        # (vocabulary lives in the module-level constants); parallel seen-sets
+        # keep the output lists ordered while dedup stays O(1)
+        seen_types = set()
+        seen_instructors = set()
+
+        for desc in single_line:
+            if desc in _COMMON_ACTIVITY_TYPES:
+                if desc not in seen_types:
+                    seen_types.add(desc)
                     result['activity_types'].append(desc)
-            elif desc in common_instructors or 'מדריכ' in desc:
-                if desc not in result['instructors']:
+            elif desc in _COMMON_INSTRUCTORS or 'מדריכ' in desc:
+                if desc not in seen_instructors:
+                    seen_instructors.add(desc)
                     result['instructors'].append(desc)
             # Check for instructor names (Hebrew names, typically 2-3 words)
-            elif (len(desc.split()) <= 3 and 
-                  any(char in desc for char in 'אבגדהוזחטיכלמנסעפצקרשת') and
-                  desc not in common_activity_types and
-                  desc not in ['האטה בזום', 'אשטנגה בסטודיו'] and  # Skip activity type variations
+            elif (len(desc.split()) <= 3 and
+                  not _HEB_CHARS.isdisjoint(desc) and
+                  desc not in _SKIP_NAMES and  # Skip activity type variations
                   not desc.strip().isdigit()):
-                if desc not in result['instructors']:
+                if desc not in seen_instructors:
+                    seen_instructors.add(desc)
                     result['instructors'].append(desc)
         
         # Extract schedule items - FIXED LOGIC
         # Look for multi-line descriptions that contain time patterns
-        for desc in all_descriptions:
-            if '\n' in desc and ':' in desc and '-' in desc:
-                lines = desc.split('\n')
+        for desc in multi_line:
+            if ':' in desc and '-' in desc:
+                lines = _lines(desc)
                 if len(lines) >= 2:
                     # Check if first line contains time pattern (HH:MM - HH:MM)
                     first_line = lines[0].strip()
-                    if ':' in first_line and '-' in first_line:
+                    if _TIME_RE.match(first_line):
                         # This looks like a schedule item!
                         schedule_item = {
                             'raw_description': desc,
@@ -713,38 +1123,43 @@ class MaccabiScraper:
                         
                         # Process remaining lines
                         for i, line in enumerate(lines[1:], 1):
-                            line_clean = line.strip()
+                            # Interned so the status/type/instructor strings
+                            # stored below exist once across all items
+                            line_clean = sys.intern(line.strip())
                             if not line_clean:
                                 continue
-                            
+
+                            # One keyword pass per line; branches below
+                            # dispatch on the hit set instead of rescanning
+                            hits = set(_LINE_RE.findall(line_clean))
+
                             # Extract availability information
-                            if any(word in line_clean for word in ['מלא', 'מקום', 'נשאר', 'נשארו', 'זמין']):
+                            if not hits.isdisjoint(_AVAIL_WORDS):
                                 schedule_item['availability_status'] = line_clean
-                                
+
                                 # Parse specific availability patterns
                                 if 'כבר מלא' in line_clean or line_clean == 'מלא':
                                     schedule_item['is_full'] = True
                                     schedule_item['spots_left'] = 0
                                 elif 'נשאר מקום אחד' in line_clean:
                                     schedule_item['spots_left'] = 1
-                                elif 'נשארו' in line_clean and 'מקומות' in line_clean:
+                                elif 'נשארו' in hits and 'מקומות' in line_clean:
                                     # Extract number from "נשארו X מקומות"
-                                    import re
-                                    numbers = re.findall(r'\d+', line_clean)
+                                    numbers = _DIGITS_RE.findall(line_clean)
                                     if numbers:
                                         schedule_item['spots_left'] = int(numbers[0])
-                                elif 'מקום' in line_clean:
+                                elif 'מקום' in hits:
                                     schedule_item['spots_left'] = 'available'
-                            
+
                             # Extract activity type (second line typically)
-                            elif i == 1 or any(word in line_clean for word in ['בסטודיו', 'בזום', 'אימון', 'פילאטיס', 'יוגה', 'FLOW', 'CLASSIC', 'Teen']):
+                            elif i == 1 or not hits.isdisjoint(_TYPE_WORDS):
                                 if not schedule_item['activity_type']:  # Take first match
                                     schedule_item['activity_type'] = line_clean
-                            
+
                             # Extract instructor name (typically last line, Hebrew name)
-                            elif (any(char in line_clean for char in 'אבגדהוזחטיכלמנסעפצקרשת') and
+                            elif (not _HEB_CHARS.isdisjoint(line_clean) and
                                   len(line_clean.split()) <= 3 and
-                                  not any(word in line_clean for word in ['מלא', 'מקום', 'בסטודיו', 'בזום'])):
+                                  hits.isdisjoint(_INSTRUCTOR_BLOCKERS)):
                                 if not schedule_item['instructor']:  # Take first match
                                     schedule_item['instructor'] = line_clean
                             
@@ -777,7 +1192,7 @@ class MaccabiScraper:
         
         # Look for schedule indicators
         has_schedule_button = any('לוח פעילויות' in elem['desc'] for elem in clickable_elements)
-        has_calendar = any(day in ' '.join(descriptions) for day in ['ראשון', 'שני', 'שלישי'])
+        has_calendar = _HEB_DAY_RE.search(self.screen_text(root)) is not None
         has_times = any(':' in desc and '-' in desc for desc in descriptions)
         
         return has_schedule_button or (has_calendar and has_times)
@@ -801,7 +1216,7 @@ class MaccabiScraper:
         
         # Use balanced scroll distance - faster than ultra-conservative but not too fast
         # This ensures we make good progress while not missing activities
-        success, _ = self.run_adb_command("adb shell input swipe 540 1400 540 1000 400")
+        success, _ = self.run_adb_command(["shell", "input", "swipe", "540", "1400", "540", "1000", "400"])
         
         # Smart waiting for scroll to complete and new content to load
         self.wait_for_content_load("activity_list", max_wait=8)
@@ -815,11 +1230,11 @@ class MaccabiScraper:
         for desc in descriptions:
             # Look for time patterns (HH:MM - HH:MM) in multi-line descriptions
             if '\n' in desc and ':' in desc and '-' in desc:
-                lines = desc.split('\n')
+                lines = _lines(desc)
                 if len(lines) >= 2:
-                    first_line = lines[0].strip()
-                    # Check if first line contains time pattern
-                    if ':' in first_line and '-' in first_line:
+                    # Anchored time match: a line like "Zoom - live:in" has
+                    # ':' and '-' but is not a slot
+                    if _TIME_RE.match(lines[0].strip()):
                         schedule_items_count += 1
         
         return schedule_items_count
@@ -858,7 +1273,7 @@ class MaccabiScraper:
         print(f"   📜 Performing single scroll for more content...")
         
         # Use a moderate scroll distance for schedule screens
-        success, _ = self.run_adb_command("adb shell input swipe 540 1400 540 900 400")
+        success, _ = self.run_adb_command(["shell", "input", "swipe", "540", "1400", "540", "900", "400"])
         
         if success:
             print(f"   ✅ Scroll completed successfully")
@@ -883,15 +1298,12 @@ class MaccabiScraper:
     
     def is_on_activities_screen(self, root: ET.Element) -> bool:
         """Simple check if we're on activities screen (has activities or activity elements)"""
-        descriptions = self.extract_all_descriptions(root)
-        clickable_elements = self.extract_clickable_elements(root)
-        
-        # Simple check: do we see activities or activity-related elements?
-        all_text = ' '.join(descriptions + [elem['desc'] for elem in clickable_elements])
-        
+        # Clickable descriptions are a subset of all descriptions, so the
+        # cached joined screen text covers both
+        all_text = self.screen_text(root)
+
         # Look for activity indicators
-        activity_indicators = ['₪', 'תל אביב', 'רמת גן', 'פילאטיס', 'יוגה', 'אימון', 'סטודיו']
-        has_activities = any(indicator in all_text for indicator in activity_indicators)
+        has_activities = _ON_SCREEN_RE.search(all_text) is not None
         
         return has_activities
     
@@ -902,7 +1314,7 @@ class MaccabiScraper:
     
     def process_single_activity(self, activity: Dict) -> Optional[Dict]:
         """Process a single activity and extract its schedule for all available days"""
-        activity_name = activity['description'].split('\n')[0] if '\n' in activity['description'] else activity['description']
+        activity_name = activity['name']
         print(f"\n🎯 Processing activity: {activity_name}")
         
         # Click on activity
@@ -955,8 +1367,16 @@ class MaccabiScraper:
             'timestamp': datetime.now().isoformat()
         }
         
-        # Track processed days to avoid duplicates
+        # Track processed days to avoid duplicates; the sorted mirror feeds
+        # the per-day progress log without re-sorting the set every day
         processed_days = set()
+        processed_days_sorted = []
+
+        # Set mirrors of the merged lists: dedup by hashable key instead of
+        # scanning the growing lists (dict equality per entry) every day
+        seen_dates = set()
+        seen_types = set()
+        seen_instructors = set()
         
         # Process each available day sequentially and accurately
         for i, day in enumerate(available_days):
@@ -1039,11 +1459,12 @@ class MaccabiScraper:
                     
                     # Mark this day as processed
                     processed_days.add(day_key)
+                    bisect.insort(processed_days_sorted, day_key)
                     print(f"✅ Marked empty day {target_day['day_number']} ({target_day['day_name']}) as processed")
-                    
+
                     combined_result['total_days_processed'] += 1
                     print(f"✅ Day {target_day['day_number']} ({target_day['day_name']}) completed: 0 schedule items (no events)")
-                    print(f"📝 Processed days so far: {sorted(processed_days)}")
+                    print(f"📝 Processed days so far: {processed_days_sorted}")
                     
                     # Small delay and continue to next day
                     time.sleep(0.5)
@@ -1080,6 +1501,7 @@ class MaccabiScraper:
                 
                 # Mark this day as processed
                 processed_days.add(day_key)
+                bisect.insort(processed_days_sorted, day_key)
                 print(f"✅ Marked day {target_day['day_number']} ({target_day['day_name']}) as processed")
                 
                 # Add to combined list
@@ -1087,29 +1509,32 @@ class MaccabiScraper:
                 
                 # Merge other data (avoiding duplicates)
                 for date_info in day_schedule['calendar_dates']:
-                    if date_info not in combined_result['calendar_dates']:
+                    date_key = (date_info['date'], date_info['day'])
+                    if date_key not in seen_dates:
+                        seen_dates.add(date_key)
                         combined_result['calendar_dates'].append(date_info)
-                
+
                 for activity_type in day_schedule['activity_types']:
-                    if activity_type not in combined_result['activity_types']:
+                    if activity_type not in seen_types:
+                        seen_types.add(activity_type)
                         combined_result['activity_types'].append(activity_type)
-                
+
                 for instructor in day_schedule['instructors']:
-                    if instructor not in combined_result['instructors']:
+                    if instructor not in seen_instructors:
+                        seen_instructors.add(instructor)
                         combined_result['instructors'].append(instructor)
                 
                 combined_result['total_days_processed'] += 1
                 
                 schedule_count = len(day_schedule['schedule_items'])
                 print(f"✅ Day {target_day['day_number']} ({target_day['day_name']}) completed: {schedule_count} schedule items")
-                print(f"📝 Processed days so far: {sorted(processed_days)}")
+                print(f"📝 Processed days so far: {processed_days_sorted}")
                 
                 # Small delay between days to ensure UI stability
                 time.sleep(1)
                 
             except Exception as e:
                 print(f"❌ Error processing day {day['day_number']}: {e}")
-                import traceback
                 traceback.print_exc()
                 continue
         
@@ -1118,14 +1543,46 @@ class MaccabiScraper:
         
         return combined_result
     
-    def save_results(self):
-        """Save results to JSON file (using same filename throughout extraction)"""
-        # Set filename once and reuse it
+    def _ensure_output_filename(self) -> str:
+        """Set the timestamped output filename once and reuse it"""
         if self.output_filename is None:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             self.output_filename = f"maccabi_activities_{timestamp}.json"
             print(f"📁 Output file set to: {self.output_filename}")
-        
+        return self.output_filename
+
+    def append_result_jsonl(self, record: Dict) -> None:
+        """Append one record to the sidecar .jsonl journal as soon as it exists
+
+        One line per finished activity, written append-only, so a crash
+        mid-run loses at most the activity in flight instead of waiting
+        for the next full re-dump. The consolidated JSON written by
+        save_results stays the canonical output for the downstream
+        filter/CSV scripts.
+        """
+        if self._jsonl_fp is None:
+            jsonl_path = os.path.splitext(self._ensure_output_filename())[0] + '.jsonl'
+            self._jsonl_fp = open(jsonl_path, 'ab')
+        if orjson is not None:
+            self._jsonl_fp.write(orjson.dumps(record) + b'\n')
+        else:
+            self._jsonl_fp.write(json.dumps(record, ensure_ascii=False).encode('utf-8') + b'\n')
+        self._jsonl_fp.flush()
+
+    def save_results(self, force: bool = False):
+        """Save results to JSON file (using same filename throughout extraction)
+
+        The full re-dump grows with the run, so routine calls are
+        debounced to at most one write every 5 seconds — the JSONL
+        journal already persists each activity immediately. Shutdown
+        paths pass force=True to guarantee a final consolidated write.
+        """
+        now = time.time()
+        if not force and self.last_save_time is not None and now - self.last_save_time < 5:
+            return self.output_filename
+        self.last_save_time = now
+        self._ensure_output_filename()
+
         output = {
             'extraction_info': {
                 'timestamp': datetime.now().isoformat(),
@@ -1138,8 +1595,20 @@ class MaccabiScraper:
             'failed_activities': self.failed_activities
         }
         
-        with open(self.output_filename, 'w', encoding='utf-8') as f:
-            json.dump(output, f, ensure_ascii=False, indent=2)
+        # Write to a sibling temp file and rename into place: os.replace is
+        # atomic on the same filesystem, so a crash mid-dump can't leave a
+        # truncated JSON where the last good checkpoint used to be
+        tmp_filename = self.output_filename + '.tmp'
+        if orjson is not None:
+            # orjson emits UTF-8 bytes directly (ensure_ascii=False
+            # equivalent) - much faster for the full-results re-dump that
+            # runs after every activity
+            with open(tmp_filename, 'wb') as f:
+                f.write(orjson.dumps(output, option=orjson.OPT_INDENT_2))
+        else:
+            with open(tmp_filename, 'w', encoding='utf-8') as f:
+                json.dump(output, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_filename, self.output_filename)
         
         # Only show save message every 10 saves to avoid spam
         if len(self.results) % 10 == 0 or len(self.results) < 10:
@@ -1216,22 +1685,21 @@ class MaccabiScraper:
             new_activities_processed = 0
             
             for i, activity in enumerate(screen_activities):
-                activity_name = activity['description'].split('\n')[0] if '\n' in activity['description'] else activity['description']
+                activity_name = activity['name']
                 
                 # Check if we've already processed this activity
-                if (activity_name in self.processed_activities or 
-                    activity_name in self.failed_activity_names):
+                if activity_name in self._seen_activity_names:
                     print(f"⏭️ Skipping already processed: {activity_name[:30]}...")
                     continue
                 
                 # Check if activity is fully visible (not cut off at edges)
-                is_fully_visible = self.is_activity_fully_visible(activity, current_root)
+                is_fully_visible = self.is_activity_fully_visible(activity)
                 if not is_fully_visible:
                     print(f"👁️ Activity partially visible, will catch it on next scroll: {activity_name[:30]}...")
                     continue
                 
                 # Update discovered activities (for coordinate tracking)
-                self.update_activity_discovery([activity])
+                self.update_activity_discovery(activity)
                 
                 print(f"\n🎯 Processing FULLY VISIBLE activity #{i+1}: {activity_name[:50]}...")
                 print(f"📍 Activity coordinates: ({activity['x']}, {activity['y']})")
@@ -1245,6 +1713,7 @@ class MaccabiScraper:
                         # Mark as processed AFTER successful extraction
                         self.mark_activity_processed(activity_name)
                         self.results.append(result)
+                        self.append_result_jsonl(result)
                         print(f"✅ Successfully processed {activity_name}")
                         new_activities_processed += 1
                         # Save JSON after every successful extraction
@@ -1253,12 +1722,14 @@ class MaccabiScraper:
                         # Mark as failed
                         self.mark_activity_failed(activity_name)
                         self.failed_activities.append(activity_name)
+                        self.append_result_jsonl({'failed_activity': activity_name})
                         print(f"❌ Failed to process {activity_name}")
                         # Also save failed attempts
                         self.save_results()
                 
                 except Exception as e:
                     print(f"❌ Exception processing {activity_name}: {e}")
+                    traceback.print_exc()
                     self.mark_activity_failed(activity_name)
                     self.failed_activities.append(activity_name)
                 
@@ -1268,50 +1739,53 @@ class MaccabiScraper:
                     print("❌ Failed to return to activities screen, stopping extraction")
                     return
                 
-                # Brief pause between activities
-                time.sleep(1)
+                # Brief pause between activities - returns early once the UI settles
+                self.wait_for_ui_idle(timeout=1.0)
                 
-                # Progress tracking
-                if len(self.results) % 10 == 0 and len(self.results) > 0:
-                    elapsed_time = time.time() - self.start_time if self.start_time else 0
-                    avg_time_per_activity = elapsed_time / len(self.results) if len(self.results) > 0 else 0
-                    
-                    print(f"\n📊 PROGRESS UPDATE: {len(self.results)} activities processed")
-                    print(f"⏱️ Time elapsed: {elapsed_time/60:.1f} minutes")
-                    print(f"📈 Average per activity: {avg_time_per_activity:.1f} seconds")
-                    print(f"🔄 Saving intermediate results...")
+                # Progress tracking - start_time is set in __init__ and
+                # result_count > 0 here, so no guards or re-lookups needed
+                result_count = len(self.results)
+                if result_count and result_count % 10 == 0:
+                    elapsed_time = time.time() - self.start_time
+                    print(f"\n📊 PROGRESS UPDATE: {result_count} activities processed"
+                          f" | ⏱️ {elapsed_time/60:.1f} min elapsed"
+                          f" | 📈 {elapsed_time/result_count:.1f}s per activity")
                     self.save_results()
             
             # Show discovery and processing stats
             stats = self.get_discovery_stats()
             print(f"📊 Current stats: {stats['discovered']} discovered, {stats['processed']} processed, {stats['failed']} failed, {new_activities_processed} new this screen")
             
-            # Check if we've reached the bottom by comparing screen content
-            current_screen_content = self.get_screen_signature(current_root)
-            
-            if last_screen_content is not None and current_screen_content == last_screen_content:
-                consecutive_identical_screens += 1
-                print(f"🔄 Screen content unchanged (identical screen #{consecutive_identical_screens})")
-                
-                # If we see the same screen content 3 times in a row, we've likely reached the bottom
-                if consecutive_identical_screens >= 3:
-                    print("🎯 BOTTOM REACHED: Screen content hasn't changed for 3 consecutive scrolls")
-                    
-                    # Do one final check for bottom indicators
-                    if self.is_at_bottom_of_list(current_root):
-                        print("✅ Confirmed: Reached bottom of activities list")
-                        break
-                    else:
-                        print("⚠️ Bottom indicators not found, continuing to scroll...")
-                        consecutive_identical_screens = 0  # Reset and keep trying
-            else:
+            # Check if we've reached the bottom by comparing screen content.
+            # A screen that just yielded new activities can't be the stuck
+            # bottom, so skip the signature work and reset the streak
+            if new_activities_processed > 0:
                 consecutive_identical_screens = 0
-                if new_activities_processed > 0:
-                    print(f"✅ Screen content changed - processed {new_activities_processed} new activities")
+                last_screen_content = None
+                print(f"✅ Processed {new_activities_processed} new activities - screen is productive, skipping identical-screen check")
+            else:
+                current_screen_content = self.get_activities_signature(screen_activities, current_root)
+
+                if last_screen_content is not None and current_screen_content == last_screen_content:
+                    consecutive_identical_screens += 1
+                    print(f"🔄 Screen content unchanged (identical screen #{consecutive_identical_screens})")
+
+                    # If we see the same screen content 3 times in a row, we've likely reached the bottom
+                    if consecutive_identical_screens >= 3:
+                        print("🎯 BOTTOM REACHED: Screen content hasn't changed for 3 consecutive scrolls")
+
+                        # Do one final check for bottom indicators
+                        if self.is_at_bottom_of_list(current_root):
+                            print("✅ Confirmed: Reached bottom of activities list")
+                            break
+                        else:
+                            print("⚠️ Bottom indicators not found, continuing to scroll...")
+                            consecutive_identical_screens = 0  # Reset and keep trying
                 else:
+                    consecutive_identical_screens = 0
                     print(f"✅ Screen content changed - no new activities to process")
-            
-            last_screen_content = current_screen_content
+
+                last_screen_content = current_screen_content
             
             # Continue scrolling unless we've definitely reached the bottom
             if scroll_attempts < max_scroll_attempts - 1:
@@ -1328,7 +1802,7 @@ class MaccabiScraper:
         print(f"\n🎯 EXTRACTION COMPLETE: {final_stats['discovered']} discovered, {final_stats['processed']} processed, {final_stats['failed']} failed")
         
         # Save results and print summary
-        self.save_results()
+        self.save_results(force=True)
         self.print_summary()
         
         print(f"\n🎉 Extraction completed successfully!")
@@ -1342,11 +1816,10 @@ def main():
         print("\n\n⚠️ Extraction interrupted by user")
         if hasattr(scraper, 'results') and scraper.results:
             print("💾 Saving partial results...")
-            scraper.save_results()
+            scraper.save_results(force=True)
             scraper.print_summary()
     except Exception as e:
         print(f"\n❌ Unexpected error: {e}")
-        import traceback
         traceback.print_exc()
 
 if __name__ == "__main__":